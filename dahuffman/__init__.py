@@ -5,4 +5,4 @@ from dahuffman.codecs import (
     load_shakespeare_lower,
     load_xml,
 )
-from dahuffman.huffmancodec import HuffmanCodec
+from dahuffman.huffmancodec import HuffmanCodec, IntegerCodec
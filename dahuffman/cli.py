@@ -0,0 +1,304 @@
+"""
+Command line interface: compress, decompress, train and benchmark.
+
+Usage examples:
+
+    python -m dahuffman compress --codec json-compact data.json -o data.json.huff
+    python -m dahuffman decompress --codec json-compact data.json.huff -o data.json
+    python -m dahuffman train --text data.json -o my-codec.pickle
+    python -m dahuffman bench --codec my-codec.pickle data.json
+
+"""
+
+import argparse
+import codecs
+import collections
+import contextlib
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, ContextManager, Iterable, Iterator, List, Optional
+
+import dahuffman.codecs
+from dahuffman.huffmancodec import HuffmanCodec, PrefixCodec
+
+_log = logging.getLogger(__name__)
+
+# Read/write chunk size (in bytes or symbols)
+CHUNK_SIZE = 64 * 1024
+
+
+def load_codec(spec: str) -> PrefixCodec:
+    """
+    Load codec from saved code table file path or name of a bundled codec (see `dahuffman.codecs`)
+    """
+    if Path(spec).is_file():
+        return PrefixCodec.load(spec)
+    try:
+        return dahuffman.codecs.load(spec)
+    except FileNotFoundError:
+        raise ValueError(
+            "No code table file or bundled codec named {s!r}".format(s=spec)
+        ) from None
+
+
+def _is_text_codec(codec: PrefixCodec) -> bool:
+    """
+    Determine whether codec works on characters (text) or byte values,
+    so that it can be used with files.
+    """
+    if codec._concat == "".join:
+        return True
+    elif codec._concat is bytes:
+        return False
+    raise ValueError(
+        "Codec should work on text or bytes, but has concat {c!r}".format(
+            c=codec._concat
+        )
+    )
+
+
+def _open_input(path: str) -> ContextManager[BinaryIO]:
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin.buffer)
+    return open(path, "rb")
+
+
+@contextlib.contextmanager
+def _open_output(path: str) -> Iterator[BinaryIO]:
+    if path == "-":
+        yield sys.stdout.buffer
+        return
+    f = open(path, "wb")
+    try:
+        with f:
+            yield f
+    except BaseException:
+        # Don't leave partial output behind.
+        Path(path).unlink()
+        raise
+
+
+class _Counter:
+    """Byte counting wrapper for (binary) file-like objects."""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self.count += len(data)
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.count += len(data)
+        return self._f.write(data)
+
+
+def _read_symbols(f, text: bool, encoding: str) -> Iterator:
+    """Read symbols (byte values or characters) from binary file in chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)() if text else None
+    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+        yield from (decoder.decode(chunk) if decoder else chunk)
+    if decoder:
+        yield from decoder.decode(b"", final=True)
+
+
+def _batched(items: Iterable, size: int = CHUNK_SIZE) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def peak_memory() -> Optional[int]:
+    """
+    Peak resident memory (in bytes) of current process, if available on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macOS, but in kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _format_stats(raw_size: int, compressed_size: int, **elapsed: float) -> str:
+    """
+    Format size, compression ratio, throughput (for each given elapsed time) and peak memory stats.
+    """
+    lines = [
+        "raw: {r} bytes, compressed: {c} bytes, ratio: {q:.4f}".format(
+            r=raw_size, c=compressed_size, q=compressed_size / max(raw_size, 1)
+        )
+    ]
+    for label, t in elapsed.items():
+        lines.append(
+            "{l}: {s:.2f} MB/s ({t:.3f} s)".format(
+                l=label, s=raw_size / 1e6 / max(t, 1e-9), t=t
+            )
+        )
+    memory = peak_memory()
+    if memory is not None:
+        lines.append("peak memory: {m:.1f} MB".format(m=memory / 1e6))
+    return "\n".join(lines) + "\n"
+
+
+def compress(args: argparse.Namespace) -> None:
+    codec = load_codec(args.codec)
+    text = _is_text_codec(codec)
+    start = time.perf_counter()
+    with _open_input(args.input) as fin, _open_output(args.output) as fout:
+        src = _Counter(fin)
+        dst = _Counter(fout)
+        encoded = codec.encode_streaming(_read_symbols(src, text, args.encoding))
+        try:
+            for batch in _batched(encoded):
+                dst.write(bytes(batch))
+        except KeyError as e:
+            raise ValueError(
+                "Symbol {s!r} not in code table".format(s=e.args[0])
+            ) from None
+    if args.stats:
+        sys.stderr.write(
+            _format_stats(src.count, dst.count, encode=time.perf_counter() - start)
+        )
+
+
+def decompress(args: argparse.Namespace) -> None:
+    codec = load_codec(args.codec)
+    text = _is_text_codec(codec)
+    start = time.perf_counter()
+    with _open_input(args.input) as fin, _open_output(args.output) as fout:
+        src = _Counter(fin)
+        dst = _Counter(fout)
+        decoded = codec.decode_streaming(_read_symbols(src, False, args.encoding))
+        for batch in _batched(decoded):
+            chunk = codec._concat(batch)
+            dst.write(chunk.encode(args.encoding) if text else chunk)
+    if args.stats:
+        sys.stderr.write(
+            _format_stats(dst.count, src.count, decode=time.perf_counter() - start)
+        )
+
+
+def train(args: argparse.Namespace) -> None:
+    frequencies = collections.Counter()
+    with _open_input(args.input) as fin:
+        for batch in _batched(_read_symbols(fin, args.text, args.encoding)):
+            frequencies.update(batch)
+    if not frequencies:
+        raise ValueError("Can not train on empty input")
+    codec = HuffmanCodec.from_frequencies(
+        frequencies, concat="".join if args.text else bytes
+    )
+    codec.save(args.output, metadata={"frequencies": frequencies})
+    if args.stats:
+        codec.print_code_table(out=sys.stderr)
+
+
+def bench(args: argparse.Namespace) -> None:
+    codec = load_codec(args.codec)
+    with _open_input(args.input) as fin:
+        raw = fin.read()
+    data = raw.decode(args.encoding) if _is_text_codec(codec) else raw
+
+    start = time.perf_counter()
+    encoded = codec.encode(data)
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = codec.decode(encoded)
+    decode_time = time.perf_counter() - start
+    if decoded != data:
+        raise RuntimeError("Decoded data does not match input data")
+
+    sys.stdout.write(
+        "codec: {c}\n".format(c=args.codec)
+        + _format_stats(len(raw), len(encoded), encode=encode_time, decode=decode_time)
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dahuffman", description="Huffman compression and decompression"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable (info) logging"
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    subparsers.required = True
+
+    def add_subparser(name: str, func, help: str, codec: bool = True):
+        subparser = subparsers.add_parser(name, help=help, description=help)
+        subparser.set_defaults(func=func)
+        if codec:
+            subparser.add_argument(
+                "-c",
+                "--codec",
+                required=True,
+                help="Name of bundled codec (e.g. 'json-compact') or path to saved code table file",
+            )
+        subparser.add_argument(
+            "input", nargs="?", default="-", help="Input file (default: stdin)"
+        )
+        subparser.add_argument(
+            "--encoding",
+            default="utf-8",
+            help="Character encoding for text codecs (default: utf-8)",
+        )
+        return subparser
+
+    for name, func, help in [
+        ("compress", compress, "Compress data"),
+        ("decompress", decompress, "Decompress data"),
+    ]:
+        subparser = add_subparser(name, func, help)
+        subparser.add_argument(
+            "-o", "--output", default="-", help="Output file (default: stdout)"
+        )
+        subparser.add_argument(
+            "-s",
+            "--stats",
+            action="store_true",
+            help="Print throughput, compression ratio and peak memory to stderr",
+        )
+
+    subparser = add_subparser(
+        "train", train, "Build Huffman code table from data", codec=False
+    )
+    subparser.add_argument(
+        "-o", "--output", required=True, help="Output file for code table"
+    )
+    subparser.add_argument(
+        "--text",
+        action="store_true",
+        help="Train on characters (decoded with --encoding) instead of bytes",
+    )
+    subparser.add_argument(
+        "-s", "--stats", action="store_true", help="Print code table to stderr"
+    )
+
+    add_subparser(
+        "bench",
+        bench,
+        "Benchmark encoding and decoding throughput, compression ratio and peak memory",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    try:
+        args.func(args)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
@@ -6,22 +6,41 @@ HuffmanCodec code tables.
 """
 
 import importlib.resources
+import os
 from functools import partial
 from pathlib import Path
 
+from dahuffman.codegen import load_specialized
 from dahuffman.huffmancodec import PrefixCodec
 
 
-def load(name: str) -> PrefixCodec:
+def _cache_dir() -> Path:
+    """
+    User cache directory for specialized code of the pre-trained codecs
+    (the package directory itself is not necessarily writable).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "dahuffman"
+
+
+def load(name: str, specialized: bool = False) -> PrefixCodec:
     """
     Load a pre-trained PrefixCodec or HuffmanCodec table by name
 
     >>> load("shakespeare")
     <dahuffman.huffmancodec.HuffmanCodec object at 0x107fe5b70>
+
+    :param name: name of the code table
+    :param specialized: whether to load as `SpecializedCodec`
+        (with compiled code cached in user cache directory, e.g. ``~/.cache/dahuffman``)
     """
     if not name.endswith(".pickle"):
         name = name + ".pickle"
     with importlib.resources.path("dahuffman.codecs", resource=name) as path:
+        if specialized:
+            return load_specialized(
+                path, cache=_cache_dir() / Path(name).with_suffix(".specialized")
+            )
         return PrefixCodec.load(path)
 
 
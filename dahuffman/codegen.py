@@ -0,0 +1,367 @@
+"""
+Code generation of encoders/decoders specialized to a fixed code table.
+
+The generic `PrefixCodec` encoding and decoding loops work bit by bit with dictionary lookups.
+For a fixed code table (e.g. a pre-trained codec), Python source code can be generated
+with the code table folded into constants:
+
+- encoder: mapping of symbol to code bit string, so that encoding boils down to
+  a string join and a single integer conversion
+- decoder: byte-indexed jump table (finite state machine over the internal nodes of the code tree),
+  so that decoding handles a full byte per table lookup, with "end of file" handling
+  folded into the table.
+
+The compiled code object and jump table can be cached on disk (e.g. next to the pickled code table),
+so that loading a specialized codec does not require generating and compiling the source again.
+"""
+
+import hashlib
+import importlib.util
+import itertools
+import logging
+import marshal
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from dahuffman.huffmancodec import _EOF, PrefixCodec, _load_code_table, ensure_dir
+
+_log = logging.getLogger(__name__)
+
+# Symbol types that can be safely rendered as literals in generated source code.
+_LITERAL_TYPES = (str, bytes, int)
+
+# Version of the layout of generated code and decoder jump table
+# (to be bumped on incompatible changes, to invalidate cached code).
+CODEGEN_FORMAT_VERSION = 1
+
+# Limit on number of symbols: the decoder jump table has 256 entries per internal code tree node.
+# Note: a 1024 symbol code table results in a jump table of about 260k entries.
+MAX_SYMBOLS = 1024
+
+
+def _check_specializable(cls: type) -> None:
+    """
+    Check that codec class can be specialized:
+    it should use the generic `PrefixCodec` bit stream encoding and decoding.
+    """
+    if not (
+        issubclass(cls, PrefixCodec)
+        and cls.encode_streaming is PrefixCodec.encode_streaming
+        and cls.decode_streaming is PrefixCodec.decode_streaming
+    ):
+        raise ValueError(
+            "Specialization of {c} is not supported".format(c=cls.__name__)
+        )
+
+
+def _symbol_expression(symbols: list, i: int) -> str:
+    """Source code expression for symbol with given index."""
+    symbol = symbols[i]
+    if type(symbol) in _LITERAL_TYPES:
+        return repr(symbol)
+    return "_symbols[%d]" % i
+
+
+def _build_decode_table(codec: PrefixCodec) -> tuple:
+    """
+    Build byte-indexed decoder jump table:
+    for each state (internal node of the code tree) and each byte value:
+    tuple of emitted symbol indices and next state (premultiplied by 256, or -1 on "end of file").
+    """
+    symbols = codec._symbols
+    codes = {(b, v): i for i, (b, v) in enumerate(zip(codec._bitsizes, codec._values))}
+    # States: internal nodes of code tree (proper prefixes of codes), starting with root.
+    states = {(0, 0): 0}
+    for b, v in codes:
+        for n in range(1, b):
+            states.setdefault((n, v >> (b - n)), len(states))
+    # Extra "dead" state for bit sequences that can not lead to a valid code.
+    dead = len(states)
+
+    # First build the (smaller) nibble-indexed table, walking the code tree bit by bit.
+    nibble_table = []
+    for prefix in itertools.chain(states, [None]):
+        for nibble in range(16):
+            emitted = []
+            next_state = dead
+            if prefix is not None:
+                n, v = prefix
+                for k in range(3, -1, -1):
+                    n, v = n + 1, (v << 1) | ((nibble >> k) & 1)
+                    if (n, v) in codes:
+                        i = codes[n, v]
+                        if symbols[i] == codec._eof:
+                            next_state = -1
+                            break
+                        emitted.append(i)
+                        n, v = 0, 0
+                    elif (n, v) not in states:
+                        break
+                else:
+                    next_state = states[n, v]
+            nibble_table.append((tuple(emitted), next_state))
+
+    # Combine high and low nibble transitions into byte transitions.
+    table = []
+    for state in range(dead + 1):
+        for high_emitted, high_state in nibble_table[state * 16 : state * 16 + 16]:
+            if high_state < 0:
+                table.extend([(high_emitted, -1)] * 16)
+                continue
+            for low_emitted, low_state in nibble_table[
+                high_state * 16 : high_state * 16 + 16
+            ]:
+                table.append(
+                    (
+                        high_emitted + low_emitted,
+                        low_state << 8 if low_state >= 0 else -1,
+                    )
+                )
+    return tuple(table)
+
+
+def _resolve_decode_table(decode_table: tuple, symbols: list) -> tuple:
+    """
+    Resolve symbol indices in decoder jump table to the actual symbols.
+    """
+    resolved = {}
+    for emitted, _ in decode_table:
+        if emitted not in resolved:
+            resolved[emitted] = tuple(symbols[i] for i in emitted)
+    return tuple((resolved[emitted], n) for emitted, n in decode_table)
+
+
+def generate_source(codec: PrefixCodec) -> str:
+    """
+    Generate Python source code of encoder and decoder specialized to code table of given codec.
+
+    The generated module defines functions ``encode(data) -> bytes``
+    and ``decode(data) -> list``, equivalent to `PrefixCodec.encode` and `PrefixCodec.decode`
+    (without concatenation).
+    Symbols that can not be rendered as literal are looked up in a ``_symbols`` list.
+    The decoder jump table is not rendered as source (which would be slow to compile),
+    but should be provided as ``_decode_table`` (see `_build_decode_table`, with resolved symbols).
+    Both should be provided in the namespace when executing the generated code.
+
+    :param codec: codec to generate specialized source code for
+    :return: Python source code
+    """
+    _check_specializable(type(codec))
+    symbols = codec._symbols
+    if len(symbols) > MAX_SYMBOLS:
+        raise ValueError(
+            "Code table too large for specialization: {n} > {m} symbols".format(
+                n=len(symbols), m=MAX_SYMBOLS
+            )
+        )
+    index = codec._get_index()
+    if codec._eof not in index:
+        raise ValueError("Code table has no 'end of file' symbol")
+    bits = [bin(v)[2:].rjust(b, "0") for b, v in zip(codec._bitsizes, codec._values)]
+    eof_bits = bits[index[codec._eof]]
+
+    lines = [
+        "# Generated by dahuffman.codegen",
+        "# Specialized encoder/decoder for code table with %d symbols" % len(symbols),
+        "",
+        "_codes = {",
+    ]
+    lines.extend(
+        "    %s: %r," % (_symbol_expression(symbols, i), b) for i, b in enumerate(bits)
+    )
+    lines.extend(
+        [
+            "}",
+            "",
+            "",
+            "def encode(data):",
+            '    bits = "".join(map(_codes.__getitem__, data))',
+            "    size = len(bits)",
+            "    if size & 7:",
+            "        # Fill up last byte with (start of) end of file code",
+            "        size = (size | 7) + 1",
+            '        bits = (bits + %r)[:size].ljust(size, "0")' % eof_bits,
+            '    return int(bits, 2).to_bytes(size >> 3, "big") if size else b""',
+            "",
+            "",
+            "def decode(data):",
+            "    table = _decode_table",
+            "    state = 0",
+            "    decoded = []",
+            "    extend = decoded.extend",
+            "    for byte in data:",
+            "        symbols, state = table[state + byte]",
+            "        extend(symbols)",
+            "        if state < 0:",
+            "            break",
+            "    return decoded",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+class SpecializedCodec(PrefixCodec):
+    """
+    Prefix code codec with encoder and decoder specialized to (and compiled for) its code table.
+    """
+
+    def __init__(
+        self,
+        code_table: dict,
+        concat: Callable = list,
+        check: bool = True,
+        eof=_EOF,
+        code=None,
+        decode_table: Optional[tuple] = None,
+    ):
+        """
+        Initialize codec with given code table.
+
+        :param code_table: mapping of symbol to code tuple (bitsize, value)
+        :param concat: function to concatenate symbols
+        :param check: whether to check the code table
+        :param eof: "end of file" symbol (customizable for advanced usage)
+        :param code: compiled code object of generated source (generated if not given)
+        :param decode_table: decoder jump table with symbol indices (built if not given)
+        """
+        super().__init__(code_table, concat=concat, check=check, eof=eof)
+        if code is None:
+            code = compile(generate_source(self), "<dahuffman.codegen>", "exec")
+        if decode_table is None:
+            decode_table = _build_decode_table(self)
+        self._code = code
+        self._decode_table = decode_table
+        namespace = {
+            "_symbols": self._symbols,
+            "_decode_table": _resolve_decode_table(decode_table, self._symbols),
+        }
+        exec(code, namespace)
+        self._encode = namespace["encode"]
+        self._decode = namespace["decode"]
+
+    @classmethod
+    def from_codec(cls, codec: PrefixCodec) -> "SpecializedCodec":
+        """
+        Build specialized codec from given codec.
+        """
+        _check_specializable(type(codec))
+        return cls(
+            codec.get_code_table(), concat=codec._concat, check=False, eof=codec._eof
+        )
+
+    def encode(self, data: Union[str, bytes, Iterable]) -> bytes:
+        """
+        Encode given data.
+
+        :param data: sequence of symbols (e.g. byte string, unicode string, list, iterator)
+        :return: byte string
+        """
+        return self._encode(data)
+
+    def decode(
+        self, data: Union[bytes, Iterable[int]], concat: Optional[Callable] = None
+    ) -> Union[str, bytes, Iterable]:
+        """
+        Decode given data.
+
+        :param data: sequence of bytes (string, list or generator of bytes)
+        :param concat: optional override of function to concatenate the decoded symbols
+        :return:
+        """
+        return (concat or self._concat)(self._decode(data))
+
+
+def _cache_key(table_data: bytes) -> bytes:
+    """
+    Cache validation key: Python bytecode version, codegen format version
+    and hash of pickled code table.
+    """
+    return (
+        importlib.util.MAGIC_NUMBER
+        + CODEGEN_FORMAT_VERSION.to_bytes(4, "big")
+        + hashlib.sha256(table_data).digest()
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to file through a temporary file,
+    so that concurrent readers never see partially written data.
+    """
+    ensure_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, str(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_specialized(
+    path: Union[str, Path], cache: Union[str, Path, bool, None] = True
+) -> SpecializedCodec:
+    """
+    Load a persisted PrefixCodec as specialized codec.
+
+    :param path: path to serialized PrefixCodec code table data.
+    :param cache: whether to cache the compiled specialized code on disk
+        (``True`` for default location next to the code table file, or explicit path,
+        e.g. when the code table file's directory is not writable).
+    :return:
+    """
+    path = Path(path)
+    table_data = path.read_bytes()
+    data = pickle.loads(table_data)
+    _check_specializable(data["type"])
+    code_table = _load_code_table(data)
+    concat = data["concat"]
+
+    if cache is True:
+        cache = path.with_suffix(".specialized")
+    if cache:
+        cache = Path(cache)
+        key = _cache_key(table_data)
+        try:
+            cached = cache.read_bytes()
+        except OSError:
+            cached = None
+        if cached and cached.startswith(key):
+            _log.info("Loading specialized code from {p!r}".format(p=str(cache)))
+            try:
+                code, decode_table = marshal.loads(cached[len(key) :])
+            except (EOFError, ValueError, TypeError) as e:
+                _log.warning(
+                    "Invalid specialized code cache {p!r}: {e!r}".format(
+                        p=str(cache), e=e
+                    )
+                )
+            else:
+                return SpecializedCodec(
+                    code_table,
+                    concat=concat,
+                    check=False,
+                    code=code,
+                    decode_table=decode_table,
+                )
+
+    _log.info("Building specialized codec from {p!r}".format(p=str(path)))
+    codec = SpecializedCodec(code_table, concat=concat, check=False)
+    if cache:
+        try:
+            _write_atomic(
+                cache, key + marshal.dumps((codec._code, codec._decode_table))
+            )
+            _log.info("Saved specialized code to {p!r}".format(p=str(cache)))
+        except OSError as e:
+            _log.warning(
+                "Failed to save specialized code to {p!r}: {e!r}".format(
+                    p=str(cache), e=e
+                )
+            )
+    return codec
@@ -1,7 +1,13 @@
+import array
+import bisect
 import collections
+import concurrent.futures
+import functools
 import itertools
 import logging
+import os
 import pickle
+import struct
 import sys
 from heapq import heapify, heappop, heappush
 from io import IOBase
@@ -11,19 +17,14 @@ from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Union
 _log = logging.getLogger(__name__)
 
 
-class _EndOfFileSymbol:
+class _SpecialSymbol:
     """
-    Internal class for "end of file" symbol to be able
-    to detect the end of the encoded bit stream,
-    which does not necessarily align with byte boundaries.
+    Internal base class for special (non-data) symbols.
     """
 
-    def __repr__(self) -> str:
-        return "_EOF"
-
-    # Because _EOF will be compared with normal symbols (strings, bytes),
+    # Because special symbols will be compared with normal symbols (strings, bytes),
     # we have to provide a minimal set of comparison methods.
-    # We'll make _EOF smaller than the rest (meaning lowest frequency)
+    # We'll make them smaller than the rest (meaning lowest frequency)
     def __lt__(self, other) -> bool:
         return True
 
@@ -37,8 +38,30 @@ class _EndOfFileSymbol:
         return hash(self.__class__)
 
 
-# Singleton-like "end of file" symbol
+class _EndOfFileSymbol(_SpecialSymbol):
+    """
+    Internal class for "end of file" symbol to be able
+    to detect the end of the encoded bit stream,
+    which does not necessarily align with byte boundaries.
+    """
+
+    def __repr__(self) -> str:
+        return "_EOF"
+
+
+class _EscapeSymbol(_SpecialSymbol):
+    """
+    Internal class for "escape" symbol, to indicate that a raw value
+    (not covered by the code table) follows in the encoded bit stream.
+    """
+
+    def __repr__(self) -> str:
+        return "_ESC"
+
+
+# Singleton-like "end of file" and "escape" symbols
 _EOF = _EndOfFileSymbol()
+_ESC = _EscapeSymbol()
 
 
 # TODO store/load code table from file
@@ -55,6 +78,120 @@ def _guess_concat(data: Any) -> Callable:
     }.get(type(data), list)
 
 
+def _split_streams(data: bytes) -> list:
+    """
+    Split interleaved multi-stream data (see `PrefixCodec.encode_interleaved`)
+    into the individual encoded streams, based on its jump table.
+    """
+    data = memoryview(data)
+    if len(data) < 1 or data[0] < 1:
+        raise ValueError("Invalid interleaved data: missing stream count")
+    offset = 1 + 4 * (data[0] - 1)
+    if len(data) < offset:
+        raise ValueError("Invalid interleaved data: truncated jump table")
+    streams = []
+    for size in struct.unpack_from(">%dI" % (data[0] - 1), data, 1):
+        if offset + size > len(data):
+            raise ValueError("Invalid interleaved data: truncated stream")
+        streams.append(data[offset : offset + size])
+        offset += size
+    streams.append(data[offset:])
+    return streams
+
+
+_BIT_MASKS = tuple((1 << (7 - k), k + 1) for k in range(8))
+
+
+def _decode_with_positions(
+    lookup: dict, data: bytes, start: int = 0, base: int = 0
+) -> Iterator[tuple]:
+    """
+    Decode given data, starting at given bit position, without "end of file" handling.
+
+    :param lookup: reverse lookup table (see `PrefixCodec._get_lookup`)
+    :param data: byte string
+    :param start: bit position in data to start decoding from
+    :param base: bit position offset for reporting
+    :return: generator of tuples: (symbol, bit position after symbol code (with offset `base`))
+    """
+    # Bit masks, paired with bit position after that bit (relative to byte start)
+    masks = _BIT_MASKS[start % 8 :]
+    # Bit position of current byte start
+    pos = base + start - start % 8
+    buffer = 1
+    for byte in memoryview(data)[start // 8 :]:
+        for m, p in masks:
+            buffer = (buffer << 1) + bool(byte & m)
+            if buffer in lookup:
+                yield lookup[buffer], pos + p
+                buffer = 1
+        masks = _BIT_MASKS
+        pos += 8
+
+
+# Number of leading code boundaries of a speculatively decoded segment
+# to consider as synchronization points (prefix codes typically self-synchronize
+# within a couple of symbols).
+_SYNC_POSITIONS = 256
+
+
+def _decode_segment(lookup: dict, segment: bytes, base: int, eof: Any = _EOF) -> tuple:
+    """
+    Speculatively decode a segment of an encoded bit stream,
+    assuming that a code starts at the start of the segment.
+
+    :return: tuple of: list of symbols (up to and including first "end of file" symbol),
+        list of (absolute) bit positions after the first `_SYNC_POSITIONS` symbol codes,
+        (absolute) bit position after last symbol code,
+        and index of first "end of file" symbol (or None).
+    """
+    symbols = []
+    ends = []
+    end = base
+    for symbol, end in _decode_with_positions(lookup, segment, base=base):
+        symbols.append(symbol)
+        if len(ends) < _SYNC_POSITIONS:
+            ends.append(end)
+        if symbol == eof:
+            return symbols, ends, end, len(symbols) - 1
+    return symbols, ends, end, None
+
+
+class _CompactCodeTable(
+    collections.namedtuple("_CompactCodeTable", ["symbols", "bitsizes", "values"])
+):
+    """
+    Compact code table representation (to limit Python object overhead with large alphabets):
+    list of symbols, with bitsizes and values in parallel arrays.
+    """
+
+    __slots__ = ()
+
+
+def _compact_array(typecode: str, items: Iterable[int]) -> Union[array.array, list]:
+    """
+    Pack integers in array of given type, falling back on plain list
+    for values that do not fit (e.g. codes longer than 64 bits with extremely skewed frequencies).
+    """
+    if isinstance(items, array.array):
+        return items
+    items = list(items)
+    try:
+        return array.array(typecode, items)
+    except OverflowError:
+        return items
+
+
+def _load_code_table(data: dict) -> Union[dict, _CompactCodeTable]:
+    """
+    Get code table from unpickled codec data (see `PrefixCodec.save`).
+    """
+    if "code_table" in data:
+        # Legacy format: mapping of symbol to (bitsize, value)
+        return data["code_table"]
+    return _CompactCodeTable(data["symbols"], data["bitsizes"], data["values"])
+
+
 def ensure_dir(path: Union[str, Path]) -> Path:
     path = Path(path)
     if not path.exists():
@@ -69,35 +206,77 @@ class PrefixCodec:
     """
 
     def __init__(
-        self, code_table: dict, concat: Callable = list, check: bool = True, eof=_EOF
+        self,
+        code_table: Union[dict, _CompactCodeTable],
+        concat: Callable = list,
+        check: bool = True,
+        eof=_EOF,
     ):
         """
         Initialize codec with given code table.
 
         :param code_table: mapping of symbol to code tuple (bitsize, value)
+            (or internal compact code table representation)
         :param concat: function to concatenate symbols
         :param check: whether to check the code table
         :param eof: "end of file" symbol (customizable for advanced usage)
         """
-        # Code table is dictionary mapping symbol to (bitsize, value)
-        self._table = code_table
-        self._concat = concat
-        self._eof = eof
+        # Compact code table representation (to limit Python object overhead with large alphabets):
+        # list of symbols, with bitsizes and values in parallel arrays.
+        if isinstance(code_table, _CompactCodeTable):
+            symbols, bitsizes, values = code_table
+        else:
+            assert isinstance(code_table, dict)
+            symbols = list(code_table.keys())
+            bitsizes = (b for (b, v) in code_table.values())
+            values = (v for (b, v) in code_table.values())
+        self._symbols = symbols if isinstance(symbols, list) else list(symbols)
+        self._bitsizes = _compact_array("H", bitsizes)
+        self._values = _compact_array("Q", values)
         if check:
-            assert isinstance(self._table, dict) and all(
-                isinstance(b, int) and b >= 1 and isinstance(v, int) and v >= 0
-                for (b, v) in self._table.values()
+            assert len(self._symbols) == len(self._bitsizes) == len(self._values)
+            assert all(
+                isinstance(b, int)
+                and b >= 1
+                and isinstance(v, int)
+                and 0 <= v < (1 << b)
+                for (b, v) in zip(self._bitsizes, self._values)
             )
             # TODO check if code table is actually a prefix code
             # TODO check if eof is in the table
             # TODO if no eof in table: automatically add entry?
+        self._concat = concat
+        self._eof = eof
+        # Symbol to index mapping for encoding, built lazily.
+        self._index = None
 
     def get_code_table(self) -> dict:
         """
         Get code table
         :return: dictionary mapping symbol to code tuple (bitsize, value)
         """
-        return self._table
+        return {
+            s: (b, v) for s, b, v in zip(self._symbols, self._bitsizes, self._values)
+        }
+
+    def _get_index(self) -> dict:
+        """
+        Get symbol to index mapping (for encoding).
+        """
+        if self._index is None:
+            self._index = {s: i for i, s in enumerate(self._symbols)}
+        return self._index
+
+    def _get_lookup(self) -> dict:
+        """
+        Get reverse lookup table for decoding:
+        mapping of code, marked with a leading 1-bit (``(1 << bitsize) + value``), to symbol.
+        Not cached, to avoid keeping a second copy of the code table around.
+        """
+        return {
+            (1 << b) + v: s
+            for s, b, v in zip(self._symbols, self._bitsizes, self._values)
+        }
 
     def print_code_table(self, out: IOBase = sys.stdout) -> None:
         """
@@ -116,7 +295,9 @@ class PrefixCodec:
                             str(val),
                             repr(symbol),
                         )
-                        for symbol, (bits, val) in self._table.items()
+                        for symbol, bits, val in zip(
+                            self._symbols, self._bitsizes, self._values
+                        )
                     ),
                 )
             )
@@ -143,12 +324,17 @@ class PrefixCodec:
         :param data: sequence of symbols (e.g. byte string, unicode string, list, iterator)
         :return: generator of bytes
         """
+        index = self._get_index()
+        bitsizes = self._bitsizes
+        values = self._values
         # Buffer value and size
         buffer = 0
         size = 0
         for s in data:
             # TODO: raise custom EncodeException instead of KeyError?
-            b, v = self._table[s]
+            i = index[s]
+            b = bitsizes[i]
+            v = values[i]
             # Shift new bits in the buffer
             buffer = (buffer << b) + v
             size += b
@@ -166,14 +352,20 @@ class PrefixCodec:
         # the end of the current byte and cut off there.
         # No new byte has to be started for the remainder, saving us one (or more) output bytes.
         if size > 0:
-            b, v = self._table[self._eof]
-            buffer = (buffer << b) + v
-            size += b
-            if size >= 8:
-                byte = buffer >> (size - 8)
-            else:
-                byte = buffer << (8 - size)
-            yield byte
+            yield self._final_byte(buffer, size)
+
+    def _final_byte(self, buffer: int, size: int) -> int:
+        """
+        Build final byte from given sub-byte buffer (of given bit size),
+        completed with (the start of) the "end of file" code.
+        """
+        i = self._get_index()[self._eof]
+        buffer = (buffer << self._bitsizes[i]) + self._values[i]
+        size += self._bitsizes[i]
+        if size >= 8:
+            return buffer >> (size - 8)
+        else:
+            return buffer << (8 - size)
 
     def decode(
         self, data: Union[bytes, Iterable[int]], concat: Optional[Callable] = None
@@ -194,22 +386,169 @@ class PrefixCodec:
         :param data: sequence of bytes (string, list or generator of bytes)
         :return: generator of symbols
         """
-        # Reverse lookup table: map (bitsize, value) to symbols
-        lookup = {(b, v): s for s, (b, v) in self._table.items()}
+        lookup = self._get_lookup()
 
-        buffer = 0
-        size = 0
+        # Bit buffer, starting with a marker bit to keep track of its size.
+        buffer = 1
         for byte in data:
             for m in [128, 64, 32, 16, 8, 4, 2, 1]:
                 buffer = (buffer << 1) + bool(byte & m)
-                size += 1
-                if (size, buffer) in lookup:
-                    symbol = lookup[size, buffer]
+                if buffer in lookup:
+                    symbol = lookup[buffer]
                     if symbol == self._eof:
                         return
                     yield symbol
-                    buffer = 0
-                    size = 0
+                    buffer = 1
+
+    def decode_parallel(
+        self,
+        data: bytes,
+        segments: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        concat: Optional[Callable] = None,
+        min_segment_size: int = 64 * 1024,
+    ) -> Union[str, bytes, Iterable]:
+        """
+        Decode given data (as produced by :py:meth:`encode`) in parallel.
+
+        The data is split in segments which are decoded speculatively in parallel,
+        assuming a code starts at each segment start.
+        Because prefix codes tend to self-synchronize, the speculative decoding of a segment
+        typically ends up on the true code boundaries after a couple of symbols.
+        The segments are stitched together by decoding sequentially from the true end
+        of the previous segment until a code boundary of the speculative decoding is hit,
+        so that only the small unsynchronized prefix of each segment is decoded twice.
+        The result is identical to :py:meth:`decode`.
+
+        :param data: byte string
+        :param segments: number of segments (default: number of CPUs)
+        :param executor: executor to decode segments with (default: process pool)
+        :param concat: optional override of function to concatenate the decoded symbols
+        :param min_segment_size: minimum segment size in bytes
+        :return:
+        """
+        data = bytes(data)
+        segments = min(
+            segments or os.cpu_count() or 1, max(1, len(data) // min_segment_size)
+        )
+        if segments <= 1:
+            return self.decode(data, concat=concat)
+
+        lookup = self._get_lookup()
+        bounds = [len(data) * k // segments for k in range(segments + 1)]
+        starts = [8 * b for b in bounds[:-1]]
+        chunks = [data[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+        args = (itertools.repeat(lookup), chunks, starts, itertools.repeat(self._eof))
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=segments) as pool:
+                results = list(pool.map(_decode_segment, *args))
+        else:
+            results = list(executor.map(_decode_segment, *args))
+
+        decoded = []
+        # True bit position of next code.
+        pos = 0
+        for start, (symbols, ends, end, eof_index) in zip(starts, results):
+            # Speculative code start positions (sorted), index in list is symbol index.
+            sync = [start] + ends[:eof_index]
+            # Sequentially decode the unsynchronized prefix.
+            sequential = _decode_with_positions(lookup, data, start=pos)
+            i = bisect.bisect_left(sync, pos)
+            while i < len(sync) and sync[i] != pos:
+                try:
+                    symbol, pos = next(sequential)
+                except StopIteration:
+                    return (concat or self._concat)(decoded)
+                if symbol == self._eof:
+                    return (concat or self._concat)(decoded)
+                decoded.append(symbol)
+                i = bisect.bisect_left(sync, pos, i)
+            if i < len(sync):
+                decoded.extend(symbols[i:eof_index])
+                if eof_index is not None:
+                    return (concat or self._concat)(decoded)
+                pos = end
+        # Decode remainder (if any) after last synchronization.
+        for symbol, pos in _decode_with_positions(lookup, data, start=pos):
+            if symbol == self._eof:
+                break
+            decoded.append(symbol)
+        return (concat or self._concat)(decoded)
+
+    def encode_interleaved(
+        self, data: Union[str, bytes, Iterable], streams: int = 4
+    ) -> bytes:
+        """
+        Encode given data as multiple independent, interleaved bit streams.
+
+        Symbols are distributed round-robin over the streams
+        (symbol ``i`` goes to stream ``i % streams``), which are each encoded separately
+        and concatenated after a small header (a "jump table", like in the 4-stream layout of Huff0):
+        one byte with the number of streams, followed by the byte size of all streams but the last
+        (as 4 byte big-endian unsigned integers).
+        Because the streams are independent, they can be decoded in lockstep or in parallel.
+
+        :param data: sequence of symbols (e.g. byte string, unicode string, list, iterator)
+        :param streams: number of streams (1 to 255)
+        :return: byte string
+        """
+        if not 1 <= streams <= 255:
+            raise ValueError("Number of streams should be between 1 and 255")
+        if not isinstance(data, (str, bytes, list, tuple, array.array)):
+            data = list(data)
+        encoded = [self.encode(data[i::streams]) for i in range(streams)]
+        header = struct.pack(
+            ">B%dI" % (streams - 1), streams, *(len(e) for e in encoded[:-1])
+        )
+        return header + b"".join(encoded)
+
+    def decode_interleaved(
+        self,
+        data: bytes,
+        concat: Optional[Callable] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Union[str, bytes, Iterable]:
+        """
+        Decode data encoded with :py:meth:`encode_interleaved`.
+
+        :param data: byte string
+        :param concat: optional override of function to concatenate the decoded symbols
+        :param executor: optional executor (e.g. process pool) to decode the streams in parallel
+        :return:
+        """
+        if executor is None:
+            return (concat or self._concat)(self.decode_interleaved_streaming(data))
+
+        streams = [bytes(s) for s in _split_streams(data)]
+        results = list(
+            executor.map(self.decode, streams, itertools.repeat(list, len(streams)))
+        )
+        # Merge round-robin distributed symbols back together.
+        total = sum(len(r) for r in results)
+        decoded = [None] * total
+        for i, symbols in enumerate(results):
+            if len(symbols) != len(range(i, total, len(results))):
+                raise ValueError("Invalid interleaved data: inconsistent stream sizes")
+            decoded[i :: len(results)] = symbols
+        return (concat or self._concat)(decoded)
+
+    def decode_interleaved_streaming(self, data: bytes) -> Iterator:
+        """
+        Decode data encoded with :py:meth:`encode_interleaved` in streaming fashion,
+        advancing the individual streams in lockstep.
+
+        :param data: byte string
+        :return: generator of symbols
+        """
+        decoders = [self.decode_streaming(s) for s in _split_streams(data)]
+        # Streams are filled round-robin, so their symbol counts are non-increasing:
+        # the first exhausted stream marks the end of the data.
+        end = object()
+        for symbols in itertools.zip_longest(*decoders, fillvalue=end):
+            for symbol in symbols:
+                if symbol is end:
+                    return
+                yield symbol
 
     def save(self, path: Union[str, Path], metadata: Any = None) -> None:
         """
@@ -218,9 +557,11 @@ class PrefixCodec:
         :param metadata: additional metadata
         :return:
         """
-        code_table = self.get_code_table()
         data = {
-            "code_table": code_table,
+            # Compact code table representation
+            "symbols": self._symbols,
+            "bitsizes": self._bitsizes,
+            "values": self._values,
             "type": type(self),
             "concat": self._concat,
         }
@@ -233,7 +574,7 @@ class PrefixCodec:
             pickle.dump(data, file=f)
         _log.info(
             "Saved {c} code table ({l} items) to {p!r}".format(
-                c=type(self).__name__, l=len(code_table), p=str(path)
+                c=type(self).__name__, l=len(self._symbols), p=str(path)
             )
         )
 
@@ -249,13 +590,13 @@ class PrefixCodec:
             data = pickle.load(f)
         cls = data["type"]
         assert issubclass(cls, PrefixCodec)
-        code_table = data["code_table"]
+        codec = cls(_load_code_table(data), concat=data["concat"])
         _log.info(
-            "Loading {c} with {l} code table items from {p!r}".format(
-                c=cls.__name__, l=len(code_table), p=str(path)
+            "Loaded {c} with {l} code table items from {p!r}".format(
+                c=cls.__name__, l=len(codec._symbols), p=str(path)
             )
         )
-        return cls(code_table, concat=data["concat"])
+        return codec
 
 
 class HuffmanCodec(PrefixCodec):
@@ -314,3 +655,198 @@ class HuffmanCodec(PrefixCodec):
         """
         frequencies = collections.Counter(data)
         return cls.from_frequencies(frequencies, concat=_guess_concat(data))
+
+
+def _zigzag_deltas(data: Iterable[int]) -> Iterator[int]:
+    """
+    Delta transform followed by zigzag mapping of signed to unsigned integers
+    (0, -1, 1, -2, 2, ... to 0, 1, 2, 3, 4, ...).
+    Values should be in signed 64 bit integer range.
+    """
+    previous = 0
+    for x in data:
+        # Explicit conversion, e.g. for NumPy integers.
+        x = int(x)
+        if not -(1 << 63) <= x < (1 << 63):
+            raise ValueError(
+                "Value out of signed 64 bit integer range: {x}".format(x=x)
+            )
+        delta = x - previous
+        previous = x
+        yield (delta << 1) if delta >= 0 else ((-delta) << 1) - 1
+
+
+class IntegerCodec(HuffmanCodec):
+    """
+    Huffman codec for integer sequences (e.g. time series of sensor readings),
+    coding the (zigzag mapped) differences between consecutive values,
+    which are typically small for slowly varying or monotonic data.
+
+    Differences that are not in the code table (outliers) are encoded with an "escape" code,
+    followed by the raw value (7 bit length field followed by the value bits).
+
+    Encoding accepts any iterable of integers (e.g. list, `array.array` or NumPy array)
+    in signed 64 bit integer range.
+    Decoding produces an `array.array` of signed 64 bit integers (typecode "q"),
+    which can be wrapped without copy as NumPy array with ``numpy.frombuffer(decoded, dtype=numpy.int64)``.
+    """
+
+    # Number of bits of the length field after the escape code.
+    ESCAPE_LENGTH_BITS = 7
+
+    def __init__(
+        self,
+        code_table: dict,
+        concat: Callable = functools.partial(array.array, "q"),
+        check: bool = True,
+        eof=_EOF,
+    ):
+        super().__init__(code_table, concat=concat, check=check, eof=eof)
+
+    @classmethod
+    def from_frequencies(
+        cls,
+        frequencies: Union[dict, Mapping],
+        concat: Optional[Callable] = None,
+        eof=_EOF,
+    ) -> "IntegerCodec":
+        """
+        Build Huffman code table from given frequencies of (zigzag mapped) differences.
+
+        :param frequencies: zigzag mapped difference to frequency mapping
+        :param concat: function to concatenate decoded values
+        :param eof: "end of file" symbol (customizable for advanced usage)
+        """
+        frequencies = dict(frequencies)
+        # Always provide an escape code for outliers.
+        frequencies.setdefault(_ESC, 1)
+        return super().from_frequencies(
+            frequencies,
+            concat=concat or functools.partial(array.array, "q"),
+            eof=eof,
+        )
+
+    @classmethod
+    def from_data(cls, data: Iterable[int], max_symbol: int = 256) -> "IntegerCodec":
+        """
+        Build Huffman code table from integer sequence.
+
+        :param data: sequence of integers (e.g. list, `array.array` or NumPy array)
+        :param max_symbol: upper limit (exclusive) for zigzag mapped differences to
+            include in the code table, larger ones are escaped
+        :return: IntegerCodec
+        """
+        frequencies = collections.Counter(
+            z if z < max_symbol else _ESC for z in _zigzag_deltas(data)
+        )
+        return cls.from_frequencies(frequencies)
+
+    def encode_streaming(self, data: Iterable[int]) -> Iterator[int]:
+        """
+        Encode given integer sequence in streaming fashion.
+
+        :param data: sequence of integers (e.g. list, `array.array` or NumPy array)
+        :return: generator of bytes
+        """
+        index = self._get_index()
+        bitsizes = self._bitsizes
+        values = self._values
+        escape = index[_ESC]
+        escape_bits = bitsizes[escape] + self.ESCAPE_LENGTH_BITS
+        escape_code = values[escape] << self.ESCAPE_LENGTH_BITS
+        # Buffer value and size
+        buffer = 0
+        size = 0
+        for z in _zigzag_deltas(data):
+            i = index.get(z)
+            if i is not None:
+                b = bitsizes[i]
+                v = values[i]
+            else:
+                # Note: differences of 64 bit integers fit the length field.
+                length = z.bit_length()
+                b = escape_bits + length
+                v = ((escape_code + length) << length) + z
+            buffer = (buffer << b) + v
+            size += b
+            while size >= 8:
+                byte = buffer >> (size - 8)
+                yield byte
+                buffer = buffer - (byte << (size - 8))
+                size -= 8
+        if size > 0:
+            yield self._final_byte(buffer, size)
+
+    def decode_parallel(
+        self,
+        data: bytes,
+        segments: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        concat: Optional[Callable] = None,
+        min_segment_size: int = 64 * 1024,
+    ) -> Iterable[int]:
+        """
+        Decode given data.
+
+        Speculative parallel decoding can not handle the raw values after escape codes,
+        nor the running sum of differences, so this falls back on (sequential) :py:meth:`decode`.
+        Other arguments are accepted for compatibility with `PrefixCodec.decode_parallel`, but ignored.
+
+        :param data: byte string
+        :param concat: optional override of function to concatenate the decoded values
+        :return:
+        """
+        return self.decode(data, concat=concat)
+
+    def decode_streaming(self, data: Union[bytes, Iterable[int]]) -> Iterator[int]:
+        """
+        Decode given data in streaming fashion
+
+        :param data: sequence of bytes (string, list or generator of bytes)
+        :return: generator of integers
+        """
+        lookup = self._get_lookup()
+        index = self._get_index()
+        i = index[self._eof]
+        eof_marker = (1 << self._bitsizes[i]) + self._values[i]
+        i = index[_ESC]
+        escape_marker = (1 << self._bitsizes[i]) + self._values[i]
+        length_marker = 1 << self.ESCAPE_LENGTH_BITS
+
+        previous = 0
+        # Bit buffer, starting with a marker bit to keep track of its size.
+        buffer = 1
+        # Number of raw bits to read (after escape code) and whether these are the length field.
+        raw = 0
+        raw_length = False
+        for byte in data:
+            for m in [128, 64, 32, 16, 8, 4, 2, 1]:
+                buffer = (buffer << 1) + bool(byte & m)
+                if raw:
+                    raw -= 1
+                    if raw:
+                        continue
+                    if raw_length:
+                        raw = buffer - length_marker
+                        raw_length = False
+                        buffer = 1
+                        if raw:
+                            continue
+                        z = 0
+                    else:
+                        # Strip marker bit
+                        z = buffer ^ (1 << (buffer.bit_length() - 1))
+                elif buffer in lookup:
+                    if buffer == eof_marker:
+                        return
+                    elif buffer == escape_marker:
+                        raw = self.ESCAPE_LENGTH_BITS
+                        raw_length = True
+                        buffer = 1
+                        continue
+                    z = lookup[buffer]
+                else:
+                    continue
+                previous += (z >> 1) ^ -(z & 1)
+                yield previous
+                buffer = 1
@@ -0,0 +1,98 @@
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+from dahuffman import load_json
+from dahuffman.cli import main
+
+DATA = '{"foo": "bar", "baz": [1, 2, 3], "title": "data stuff"}\n' * 100
+
+
+@pytest.mark.parametrize("codec", ["json", "json.pickle"])
+def test_compress_decompress(tmp_path: Path, codec):
+    path = tmp_path / "data.json"
+    path.write_text(DATA, encoding="utf-8")
+    main(["compress", "--codec", codec, str(path), "-o", str(tmp_path / "data.huff")])
+    encoded = (tmp_path / "data.huff").read_bytes()
+    assert len(encoded) < len(DATA)
+    main(
+        [
+            "decompress",
+            "-c",
+            codec,
+            str(tmp_path / "data.huff"),
+            "-o",
+            str(tmp_path / "data.out"),
+        ]
+    )
+    assert (tmp_path / "data.out").read_text(encoding="utf-8") == DATA
+
+
+def test_compress_stdin_stdout(monkeypatch, capsysbinary):
+    monkeypatch.setattr(
+        sys, "stdin", io.TextIOWrapper(io.BytesIO(DATA.encode("utf-8")))
+    )
+    main(["compress", "-c", "json", "-s"])
+    out, err = capsysbinary.readouterr()
+    assert out == load_json().encode(DATA)
+    assert b"ratio" in err
+    assert b"MB/s" in err
+
+
+@pytest.mark.parametrize("text", [False, True])
+def test_train_and_bench(tmp_path: Path, capsys, text):
+    data = DATA + "hëllò wørl∂\n"
+    path = tmp_path / "data.txt"
+    path.write_text(data, encoding="utf-8")
+    codec_path = str(tmp_path / "codec.pickle")
+    main(["train", str(path), "-o", codec_path] + (["--text"] if text else []))
+    main(["compress", "-c", codec_path, str(path), "-o", str(tmp_path / "data.huff")])
+    main(
+        [
+            "decompress",
+            "-c",
+            codec_path,
+            str(tmp_path / "data.huff"),
+            "-o",
+            str(tmp_path / "data.out"),
+        ]
+    )
+    assert (tmp_path / "data.out").read_text(encoding="utf-8") == data
+
+    main(["bench", "-c", codec_path, str(path)])
+    out, err = capsys.readouterr()
+    assert "encode:" in out
+    assert "decode:" in out
+    assert "ratio:" in out
+
+
+def test_unknown_codec(tmp_path: Path):
+    with pytest.raises(SystemExit):
+        main(["compress", "-c", "nope", "-o", str(tmp_path / "out")])
+
+
+def test_compress_unknown_symbol(tmp_path: Path, capsys):
+    path = tmp_path / "data.txt"
+    path.write_text("Hello\nWorld\n" * 10000, encoding="utf-8")
+    output = tmp_path / "data.huff"
+    with pytest.raises(SystemExit):
+        main(["compress", "-c", "json-compact", str(path), "-o", str(output)])
+    assert "not in code table" in capsys.readouterr().err
+    assert not output.exists()
+
+
+def test_missing_input(tmp_path: Path, capsys):
+    with pytest.raises(SystemExit):
+        main(["compress", "-c", "json", str(tmp_path / "nope.json")])
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_train_empty_input(tmp_path: Path, capsys):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with pytest.raises(SystemExit):
+        main(["train", str(path), "-o", str(tmp_path / "codec.pickle")])
+    assert "empty input" in capsys.readouterr().err
+    assert not (tmp_path / "codec.pickle").exists()
@@ -0,0 +1,164 @@
+from pathlib import Path
+
+import pytest
+
+import dahuffman.codegen
+from dahuffman import HuffmanCodec, IntegerCodec
+from dahuffman.codecs import load
+from dahuffman.codegen import SpecializedCodec, generate_source, load_specialized
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "hello world, how are you doing today?",
+        b"hello world, how are you doing today?",
+        "hëllò wørl∂, høw åré ¥øü døin§ tø∂@¥?",
+        ["apple", "pear", "orange", "apple", "lemon", "pear"],
+        [("king", "w"), ("queen", "e", 3), ("pawn", "n"), ("king", "w")],
+    ],
+)
+def test_specialized_codec(data):
+    codec = HuffmanCodec.from_data(data)
+    specialized = SpecializedCodec.from_codec(codec)
+    for sample in [data, data[:1], data[:5], data[:0]]:
+        encoded = specialized.encode(sample)
+        assert encoded == codec.encode(sample)
+        assert specialized.decode(encoded) == codec.decode(encoded) == sample
+
+
+def test_specialized_custom_eof():
+    codec = HuffmanCodec.from_frequencies({"A": 5, "B": 3, "C": 2}, eof="Z")
+    specialized = SpecializedCodec.from_codec(codec)
+    encoded = specialized.encode("ABCACBZABAB")
+    assert encoded == codec.encode("ABCACBZABAB")
+    assert specialized.decode(encoded) == "ABCACB"
+
+
+def test_specialized_decode_concat():
+    codec = SpecializedCodec.from_codec(HuffmanCodec.from_data([1, 2, 3]))
+    encoded = codec.encode([1, 2, 1, 2, 3, 2, 1])
+    assert codec.decode(encoded, concat=sum) == 12
+
+
+def test_generate_source():
+    codec = HuffmanCodec.from_frequencies({"a": 2, "b": 4, "c": 8})
+    source = generate_source(codec)
+    assert "'c': '1'," in source
+    assert "def encode(data):" in source
+    assert "def decode(data):" in source
+
+
+def test_specialized_large_code_table():
+    data = [i % 1000 for i in range(0, 5000, 7)]
+    codec = HuffmanCodec.from_data(range(1000))
+    # Jump table is not rendered as source code
+    assert len(generate_source(codec)) < 100000
+    specialized = SpecializedCodec.from_codec(codec)
+    assert specialized.encode(data) == codec.encode(data)
+    assert specialized.decode(codec.encode(data)) == data
+
+
+def test_generate_source_too_large():
+    codec = HuffmanCodec.from_data(range(2000))
+    with pytest.raises(ValueError, match="too large"):
+        generate_source(codec)
+
+
+def test_load_specialized(tmp_path: Path):
+    data = "hello world, how are you doing today?"
+    codec = HuffmanCodec.from_data(data)
+    path = tmp_path / "codec.pickle"
+    codec.save(path)
+
+    specialized = load_specialized(path)
+    cache = tmp_path / "codec.specialized"
+    assert cache.exists()
+    assert specialized.decode(specialized.encode(data)) == data
+
+    # Load from cache
+    mtime = cache.stat().st_mtime_ns
+    specialized = load_specialized(path)
+    assert cache.stat().st_mtime_ns == mtime
+    assert specialized.encode(data) == codec.encode(data)
+
+    # Invalidate cache with new code table
+    codec = HuffmanCodec.from_data("foo bar")
+    codec.save(path)
+    specialized = load_specialized(path)
+    assert specialized.encode("foo bar") == codec.encode("foo bar")
+
+
+def test_load_specialized_no_cache(tmp_path: Path):
+    path = tmp_path / "codec.pickle"
+    HuffmanCodec.from_data("foo bar").save(path)
+    specialized = load_specialized(path, cache=False)
+    assert specialized.decode(specialized.encode("bar foo")) == "bar foo"
+    assert not (tmp_path / "codec.specialized").exists()
+
+
+def test_load_bundled_specialized(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    data = '{"foo":"bar","baz":[1,2,3,4,5,6],"title":"data stuff"}'
+    codec = load("json-compact")
+    specialized = load("json-compact", specialized=True)
+    assert isinstance(specialized, SpecializedCodec)
+    assert specialized.encode(data) == codec.encode(data)
+    assert specialized.decode(codec.encode(data)) == data
+    # Cache in user cache directory, not in package directory
+    assert (tmp_path / "cache" / "dahuffman" / "json-compact.specialized").exists()
+    package_dir = Path(dahuffman.codegen.__file__).parent / "codecs"
+    assert not list(package_dir.glob("*.specialized"))
+
+
+def test_load_specialized_integer_codec(tmp_path: Path):
+    path = tmp_path / "integers.pickle"
+    IntegerCodec.from_data(range(8)).save(path)
+    with pytest.raises(ValueError, match="IntegerCodec"):
+        load_specialized(path)
+    assert not (tmp_path / "integers.specialized").exists()
+
+
+def test_load_specialized_corrupt_cache(tmp_path: Path):
+    data = "hello world, how are you doing today?"
+    codec = HuffmanCodec.from_data(data)
+    path = tmp_path / "codec.pickle"
+    codec.save(path)
+    load_specialized(path)
+    cache = tmp_path / "codec.specialized"
+    # Truncate cache, but keep (most of) it
+    cache.write_bytes(cache.read_bytes()[:-20])
+
+    specialized = load_specialized(path)
+    assert specialized.encode(data) == codec.encode(data)
+    # Cache is regenerated
+    specialized = load_specialized(path)
+    assert specialized.decode(codec.encode(data)) == data
+    # No temporary files left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "codec.pickle",
+        "codec.specialized",
+    ]
+
+
+def test_specialize_integer_codec():
+    codec = IntegerCodec.from_data(range(8))
+    with pytest.raises(ValueError, match="IntegerCodec"):
+        SpecializedCodec.from_codec(codec)
+    with pytest.raises(ValueError, match="IntegerCodec"):
+        generate_source(codec)
+
+
+def test_load_specialized_format_version(tmp_path: Path, monkeypatch):
+    data = "hello world"
+    path = tmp_path / "codec.pickle"
+    HuffmanCodec.from_data(data).save(path)
+    load_specialized(path)
+    cache = tmp_path / "codec.specialized"
+    cached = cache.read_bytes()
+
+    # Cache from other codegen format version should not be used
+    monkeypatch.setattr(dahuffman.codegen, "CODEGEN_FORMAT_VERSION", 999)
+    specialized = load_specialized(path)
+    assert specialized.decode(specialized.encode(data)) == data
+    assert cache.read_bytes() != cached
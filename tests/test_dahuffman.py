@@ -1,12 +1,17 @@
 # coding=utf-8
+import array
+import collections
+import concurrent.futures
 import io
+import pickle
 import re
 from io import StringIO
 from pathlib import Path
 
 import pytest
 
-from dahuffman import HuffmanCodec
+import dahuffman.huffmancodec
+from dahuffman import HuffmanCodec, IntegerCodec
 from dahuffman.huffmancodec import _EOF, PrefixCodec
 
 # TODO test streaming
@@ -157,3 +162,260 @@ def test_custom_eof_in_frequencies():
     codec = HuffmanCodec.from_frequencies({"A": 5, "B": 3, "C": 2, "Z": 8}, eof="Z")
     encoded = codec.encode("ABCACBZABAB")
     assert codec.decode(encoded) == "ABCACB"
+
+
+@pytest.mark.parametrize("streams", [1, 2, 3, 4, 7])
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "a",
+        "hello world, how are you doing today?",
+        b"hello world, how are you doing today?",
+        ["apple", "pear", "orange", "apple", "lemon", "pear"],
+    ],
+)
+def test_interleaved(data, streams):
+    codec = HuffmanCodec.from_data(data or "xyz")
+    encoded = codec.encode_interleaved(data, streams=streams)
+    assert type(encoded) == type(b"")
+    assert encoded[0] == streams
+    assert codec.decode_interleaved(encoded, concat=list) == list(data)
+
+
+@pytest.mark.parametrize("streams", [1, 3, 4])
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "ab",
+        "hello world, how are you doing today?",
+        ["apple", "pear", "orange", "apple", "lemon", "pear"],
+    ],
+)
+def test_interleaved_executor(data, streams):
+    codec = HuffmanCodec.from_data(data or "xyz")
+    encoded = codec.encode_interleaved(data, streams=streams)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = codec.decode_interleaved(encoded, executor=executor)
+    assert decoded == codec.decode_interleaved(encoded)
+    assert list(decoded) == list(data)
+
+
+def test_interleaved_process_pool():
+    data = "hello world, how are you doing today?" * 100
+    codec = HuffmanCodec.from_data(data)
+    encoded = codec.encode_interleaved(data)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        assert codec.decode_interleaved(encoded, executor=executor) == data
+
+
+def test_interleaved_iterator():
+    data = "abracadabra" * 10
+    codec = HuffmanCodec.from_data(data)
+    encoded = codec.encode_interleaved(iter(data))
+    assert codec.decode_interleaved(encoded) == data
+    assert len(encoded) <= len(codec.encode(data)) + 1 + 3 * 4 + 3
+
+
+def test_interleaved_non_sliceable():
+    data = collections.deque("abracadabra")
+    codec = HuffmanCodec.from_data("abracadabra")
+    encoded = codec.encode_interleaved(data, streams=3)
+    assert codec.decode_interleaved(encoded) == "abracadabra"
+
+
+def test_interleaved_invalid():
+    codec = HuffmanCodec.from_data("abc")
+    with pytest.raises(ValueError):
+        codec.encode_interleaved("abc", streams=0)
+    with pytest.raises(ValueError):
+        codec.decode_interleaved(b"")
+    with pytest.raises(ValueError):
+        codec.decode_interleaved(b"\x04\x00\x00")
+    with pytest.raises(ValueError):
+        codec.decode_interleaved(b"\x02\x00\x00\x00\x09abc")
+
+
+def test_get_code_table():
+    code_table = {"A": (2, 0), "B": (2, 1), _EOF: (2, 3)}
+    codec = PrefixCodec(code_table, check=True)
+    assert codec.get_code_table() == code_table
+
+
+def test_long_codes():
+    # Fibonacci frequencies give maximally skewed code lengths (more than 255 bits)
+    frequencies = {}
+    a, b = 1, 2
+    for i in range(300):
+        frequencies[i] = a
+        a, b = b, a + b
+    codec = HuffmanCodec.from_frequencies(frequencies)
+    assert max(b for (b, v) in codec.get_code_table().values()) > 255
+    data = [0, 1, 299, 2, 298, 0, 150]
+    assert codec.decode(codec.encode(data)) == data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        [0],
+        [5, 5, 5, 5],
+        [1000, 1001, 1003, 1003, 1004, 1010, 1011],
+        [10, 8, 7, -3, -5, 0, 20000, 20001, 19999, -(2**63), 2**63 - 1],
+        list(range(-300, 300, 3)),
+    ],
+)
+def test_integer_codec(data):
+    codec = IntegerCodec.from_data(data)
+    encoded = codec.encode(data)
+    assert type(encoded) == type(b"")
+    decoded = codec.decode(encoded)
+    assert isinstance(decoded, array.array)
+    assert decoded == array.array("q", data)
+
+
+def test_integer_codec_array_input():
+    data = array.array("q", [1000 + 3 * i for i in range(1000)])
+    codec = IntegerCodec.from_data(data)
+    encoded = codec.encode(data)
+    assert len(encoded) < 200
+    assert codec.decode(encoded) == data
+
+
+def test_integer_codec_escape():
+    # Code table only covers zigzag mapped difference 2 (delta +1)
+    codec = IntegerCodec.from_frequencies({2: 10})
+    data = [0, 1, 2, 3, 3, 3, -100, -99, 10**18, 10**18 + 1, -(2**63), 2**63 - 1]
+    assert codec.decode(codec.encode(data)) == array.array("q", data)
+
+
+def test_integer_codec_out_of_range():
+    codec = IntegerCodec.from_data([0, 1, 2])
+    with pytest.raises(ValueError, match="64 bit"):
+        codec.encode([0, 10**20])
+    with pytest.raises(ValueError, match="64 bit"):
+        codec.encode([-(2**63) - 1])
+
+
+def test_integer_codec_save(tmp_path: Path):
+    data = [10, 12, 14, 15, 17, 19, 19, 21]
+    codec1 = IntegerCodec.from_data(data)
+    path = tmp_path / "integers.huff"
+    codec1.save(path)
+    codec2 = PrefixCodec.load(path)
+    assert isinstance(codec2, IntegerCodec)
+    assert codec2.encode(data) == codec1.encode(data)
+    assert codec2.decode(codec1.encode(data)) == array.array("q", data)
+
+
+@pytest.mark.parametrize("segments", [2, 3, 7, 100])
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "a",
+        "hello world, how are you doing today?" * 20,
+        "hëllò wørl∂, høw åré ¥øü døin§ tø∂@¥?" * 20,
+        ["apple", "pear", "orange", "apple", "lemon", "pear"] * 20,
+    ],
+)
+def test_decode_parallel(data, segments):
+    codec = HuffmanCodec.from_data(data or "xyz")
+    encoded = codec.encode(data)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = codec.decode_parallel(
+            encoded, segments=segments, executor=executor, min_segment_size=1
+        )
+    assert decoded == codec.decode(encoded)
+    assert decoded == data
+
+
+def test_decode_parallel_custom_eof():
+    codec = HuffmanCodec.from_frequencies({"A": 5, "B": 3, "C": 2}, eof="Z")
+    encoded = codec.encode("ABCACBZABAB" * 20)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = codec.decode_parallel(
+            encoded, segments=5, executor=executor, min_segment_size=1
+        )
+    assert decoded == "ABCACB"
+
+
+@pytest.mark.parametrize("sync_positions", [0, 1, 2])
+def test_decode_parallel_limited_sync_positions(sync_positions, monkeypatch):
+    monkeypatch.setattr(dahuffman.huffmancodec, "_SYNC_POSITIONS", sync_positions)
+    data = "hëllò wørl∂, høw åré ¥øü døin§ tø∂@¥?" * 20
+    codec = HuffmanCodec.from_data(data)
+    encoded = codec.encode(data)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = codec.decode_parallel(
+            encoded, segments=7, executor=executor, min_segment_size=1
+        )
+    assert decoded == data
+
+
+def test_decode_segment_stops_at_eof():
+    codec = HuffmanCodec.from_frequencies({"A": 5, "B": 3, "C": 2}, eof="Z")
+    encoded = codec.encode("ABCZACB")
+    symbols, ends, end, eof_index = dahuffman.huffmancodec._decode_segment(
+        codec._get_lookup(), encoded, base=0, eof="Z"
+    )
+    assert symbols == ["A", "B", "C", "Z"]
+    assert eof_index == 3
+    assert end == ends[-1]
+    assert len(ends) == 4
+
+
+def test_decode_parallel_process_pool():
+    data = "hello world, how are you doing today?" * 100
+    codec = HuffmanCodec.from_data(data)
+    encoded = codec.encode(data)
+    assert codec.decode_parallel(encoded, segments=2, min_segment_size=1) == data
+
+
+def test_integer_codec_decode_parallel():
+    data = [10, 12, 14, 15, 17, 19, 19, 21, 10**9, 10**9 + 1] * 50
+    codec = IntegerCodec.from_data(data)
+    encoded = codec.encode(data)
+    decoded = codec.decode_parallel(encoded, segments=4, min_segment_size=1)
+    assert decoded == codec.decode(encoded)
+    assert decoded == array.array("q", data)
+
+
+def test_save_compact_format(tmp_path: Path, monkeypatch):
+    data = "aabcbcdbabdbcbd"
+    codec1 = HuffmanCodec.from_data(data)
+    path = tmp_path / "codec.huff"
+
+    def get_code_table(self):
+        raise RuntimeError("Code table dictionary should not be built")
+
+    monkeypatch.setattr(PrefixCodec, "get_code_table", get_code_table)
+    codec1.save(path)
+    with path.open("rb") as f:
+        saved = pickle.load(f)
+    assert "code_table" not in saved
+    assert isinstance(saved["bitsizes"], array.array)
+    assert isinstance(saved["values"], array.array)
+
+    codec2 = PrefixCodec.load(path)
+    assert isinstance(codec2, HuffmanCodec)
+    assert codec2._symbols == codec1._symbols
+    assert codec2._bitsizes == codec1._bitsizes
+    assert codec2._values == codec1._values
+    assert codec2.encode(data) == codec1.encode(data)
+    assert codec2.decode(codec1.encode(data)) == data
+
+
+def test_load_legacy_format(tmp_path: Path):
+    code_table = {"A": (2, 0), "B": (2, 1), _EOF: (2, 3)}
+    path = tmp_path / "legacy.huff"
+    with path.open("wb") as f:
+        pickle.dump(
+            {"code_table": code_table, "type": PrefixCodec, "concat": "".join}, f
+        )
+    codec = PrefixCodec.load(path)
+    assert codec.get_code_table() == code_table
+    assert codec.encode("ABBA") == b"\x14"
+    assert codec.decode(b"\x14") == "ABBA"